@@ -23,11 +23,117 @@
 """Command line interface definition."""
 
 import argparse
-import glob
+import collections
+import concurrent.futures
+import functools
+import os
+import sys
 from pathlib import Path
 
 from sem_io import __version__
-from sem_io.metadata_extractor import SEMparams
+from sem_io.metadata_extractor import SEMIOError, SEMparams
+
+# maximum number of images submitted to the thread pool ahead of the one
+# being printed
+_MAX_PENDING = 64
+
+
+def _process_image(image_path, dump=False):
+    """
+    Read the parameters from the header of one SEM image without
+    printing them and optionally dump the selected parameters to a
+    json file next to the image.
+
+    Parameters
+    ----------
+    image_path : STR | Path
+        Full path to an SEM image (.tif) recorded with either
+        Zeiss SmartSEM or Thermo Fisher Scientific xT.
+    dump : BOOL, optional
+        If True, the selected parameters are stored in the same
+        directory as the image, in a json file named after the image
+        (without the .tif extension) plus _metadata.json.
+        The default is False.
+
+    Returns
+    -------
+    image_path : STR | Path
+        The image path, as given.
+    s_p : SEMparams | SEMIOError
+        The parameters extracted from the image, or the error raised
+        if the image is not a .tif file from a supported software.
+    """
+    try:
+        s_p = SEMparams(image_path, verbose=False)
+    except SEMIOError as e:
+        return image_path, e
+    if dump:
+        fn = s_p.img_path.parent.joinpath(s_p.img_path.stem + "_metadata.json")
+        s_p.dump_params_to_json(s_p.params_grouped, fn, image_path=None)
+    return image_path, s_p
+
+
+def _iter_image_paths(paths):
+    """
+    Yield the paths of the images to process, lazily.
+
+    Parameters
+    ----------
+    paths : LIST of STR
+        Paths given at the command line. Files are yielded as they are,
+        for folders the .tif and .tiff files directly inside each folder
+        are yielded.
+
+    Yields
+    ------
+    STR | Path
+        Path to one image.
+    """
+    for p_img in paths:
+        p_img = Path(p_img)
+        if p_img.is_file():
+            yield p_img
+        elif p_img.is_dir():
+            with os.scandir(p_img) as it:
+                for entry in it:
+                    name = entry.name.lower()
+                    if (
+                        not name.startswith(".")
+                        and name.endswith((".tif", ".tiff"))
+                        and entry.is_file()
+                    ):
+                        yield entry.path
+
+
+def _map_ordered(ex, fn, iterable, max_pending=_MAX_PENDING):
+    """
+    Like ex.map(fn, iterable), but submitting the calls while iterating,
+    so that the results of the first items are yielded before the
+    iterable is exhausted.
+
+    Parameters
+    ----------
+    ex : concurrent.futures.Executor
+        The executor running the calls.
+    fn : callable
+        Function called with each item.
+    iterable : iterable
+        The items, possibly produced lazily.
+    max_pending : INT, optional
+        Maximum number of calls submitted but not yet yielded.
+        The default is _MAX_PENDING.
+
+    Yields
+    ------
+    The results of fn, in the order of the items.
+    """
+    pending = collections.deque()
+    for item in iterable:
+        pending.append(ex.submit(fn, item))
+        if len(pending) >= max_pending:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
 
 
 def cli():
@@ -47,7 +153,7 @@ def cli():
         "folder(s) containing several .tif images. The images must "
         "have been produced by either the Zeiss SmartSEM or the "
         "Thermo Fisher Scientific xT software. In the case of folders, "
-        "all the .tif images within each folder will be processed."
+        "all the .tif (or .tiff) images within each folder will be processed."
     )
     parser.add_argument("image_path", nargs="+", help=path_help)
 
@@ -82,19 +188,13 @@ def cli():
         err_msg = "Printing and saving both suppressed (-s but no -d): nothing to do."
         parser.error(err_msg)
 
-    for p_img in args.image_path:
-        p_img = Path(p_img)
-        if p_img.is_file():
-            s_p = SEMparams(p_img, verbose=verbose)
-            if args.dump:
-                fn = p_img.parent.joinpath(p_img.stem + "_metadata.json")
-                s_p.dump_params_to_json(s_p.params_grouped, fn, image_path=None)
-        else:
-            all_tifs = glob.glob(p_img.joinpath("*.tif").as_posix())
-            for i in all_tifs:
-                s_p = SEMparams(i, verbose=verbose)
-                if args.dump:
-                    fn = s_p.img_path.parent.joinpath(
-                        s_p.img_path.stem + "_metadata.json"
-                    )
-                    s_p.dump_params_to_json(s_p.params_grouped, fn, image_path=None)
+    # the images are read (and dumped) concurrently while the folders are
+    # still being listed, but printed in order
+    process = functools.partial(_process_image, dump=args.dump)
+    paths = _iter_image_paths(args.image_path)
+    with concurrent.futures.ThreadPoolExecutor() as ex:
+        for p_img, s_p in _map_ordered(ex, process, paths):
+            if isinstance(s_p, SEMIOError):
+                print(f"skipping {p_img}: {s_p}", file=sys.stderr)
+            elif verbose:
+                s_p.print_params()
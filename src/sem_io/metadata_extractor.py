@@ -26,13 +26,193 @@ stored in the header of SEM images (.tif) recorded using either the software
 Zeiss SmartSEM or the software Thermo Fisher Scientific xT.
 """
 
+import concurrent.futures
 import contextlib
+import functools
 import json
 import math
+import mmap
+import os
+import re
+import struct
+import sys
 from pathlib import Path
 
 from PIL import Image
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_EMPTY = {}
+
+_TIFF_BYTE_ORDERS = {b"II": "<", b"MM": ">"}
+_TIFF_ASCII = 2
+_MMAP_THRESHOLD = 256 * 1024**2
+
+# a bare "\r" or "\n" line ending, for Zeiss headers without "\r\n"
+_LINE_END_RE = re.compile(r"[\r\n]")
+# a "[Group]" line and everything up to the next line starting with "["
+_TF_GROUP_RE = re.compile(r"^(\[[^\]\r\n]+\])[^\r\n]*(.*?)(?=^\[|\Z)", re.M | re.S)
+# one "Name=value" line, without the surrounding whitespace
+_TF_ENTRY_RE = re.compile(
+    r"^[ \t]*([^=\r\n]*?)[ \t]*=[ \t]*([^\r\n]*?)[ \t]*\r?$", re.M
+)
+
+
+class SEMIOError(Exception):
+    """Raised when an image is not a .tif file from a supported software."""
+
+
+def _grouping_plan(groups, locs):
+    """
+    Flatten a groups table and the corresponding locations table into
+    a tuple of (group, parameter, location) triples, in display order.
+    """
+    return tuple(
+        (grp, param, locs[param]) for grp, names in groups.items() for param in names
+    )
+
+
+def _grouping_template(groups, file_key):
+    """
+    Return a dict of dicts with the groups and parameters of groups in
+    display order and empty values, where file_key and "Manufacturer"
+    are added to the "General" group as its first and fourth entries.
+    """
+    template = {k: dict.fromkeys(v, "") for k, v in groups.items()}
+    general = list(template["General"])
+    general.insert(0, file_key)
+    general.insert(3, "Manufacturer")
+    template["General"] = dict.fromkeys(general, "")
+    return template
+
+
+def _intern_names(*tables):
+    """
+    Intern the keys and the string values (or the strings in list values)
+    of the given dicts and return a dict mapping each string to its
+    interned copy.
+    """
+    interned = {}
+    for table in tables:
+        for k, v in table.items():
+            for name in (k, v) if isinstance(v, str) else (k, *v):
+                interned[name] = sys.intern(name)
+    return interned
+
+
+def _split_kv(line):
+    """
+    Split one line of a Zeiss SmartSEM header into name and value at the
+    first "=", or at the first ":" if there is no "=". Return None if
+    there is neither.
+    """
+    k, sep, v = line.partition("=")
+    if not sep:
+        k, sep, v = line.partition(":")
+        if not sep:
+            return None
+    return k, v
+
+
+def _check_tif_path(image_path):
+    """
+    Return image_path as a str, raising SEMIOError if it does not end
+    with .tif or .tiff (in any case).
+    """
+    image_path = os.fspath(image_path)
+    if not image_path.lower().endswith((".tif", ".tiff")):
+        msg = "sem_io: the image path must point to a .tif or .tiff file."
+        raise SEMIOError(msg) from None
+    return image_path
+
+
+def _read_first_ifd_ascii_tags(read, tags):
+    """
+    Walk the first IFD of a classic TIFF file and return the ASCII tags
+    whose numbers are in tags, decoded in the same way as Pillow does.
+
+    read(offset, size) must return up to size bytes of the file starting
+    at offset. None is returned if the data is not a classic TIFF file or
+    one of the requested tags is not of type ASCII, so that the caller can
+    fall back to Pillow.
+    """
+    head = read(0, 8)
+    byte_order = _TIFF_BYTE_ORDERS.get(head[:2])
+    if byte_order is None or len(head) < 8:
+        return None
+    magic, ifd_offset = struct.unpack(byte_order + "HI", head[2:])
+    if magic != 42:
+        return None
+
+    n_entries = read(ifd_offset, 2)
+    if len(n_entries) < 2:
+        return None
+    n_entries = struct.unpack(byte_order + "H", n_entries)[0]
+    entries = read(ifd_offset + 2, 12 * n_entries)
+    if len(entries) < 12 * n_entries:
+        return None
+
+    found = {}
+    for i in range(0, 12 * n_entries, 12):
+        tag, tag_type, count, offset = struct.unpack_from(
+            byte_order + "HHII", entries, i
+        )
+        if tag not in tags:
+            continue
+        if tag_type != _TIFF_ASCII:
+            return None
+        if count <= 4:
+            data = entries[i + 8 : i + 8 + count]
+        else:
+            data = read(offset, count)
+        if len(data) < count:
+            return None
+        if data.endswith(b"\0"):
+            data = data[:-1]
+        found[tag] = data.decode("latin-1")
+
+    return found
+
+
+def _read_tiff_ascii_tags(image_path, tags):
+    """
+    Read ASCII tags from the first IFD of a TIFF file without opening
+    the image with Pillow. See _read_first_ifd_ascii_tags().
+
+    Files smaller than _MMAP_THRESHOLD are memory-mapped, so that the
+    tags are sliced straight from the page cache. Larger files, or files
+    which cannot be mapped, are read with one os.pread call per field
+    (or seek and read where os.pread is not available).
+    """
+    with open(image_path, "rb") as f:
+        mm = None
+        if 0 < os.fstat(f.fileno()).st_size < _MMAP_THRESHOLD:
+            with contextlib.suppress(OSError, ValueError):
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if mm is not None:
+            with mm:
+                return _read_first_ifd_ascii_tags(
+                    lambda offset, size: mm[offset : offset + size], tags
+                )
+
+        if hasattr(os, "pread"):
+            fd = f.fileno()
+
+            def read(offset, size):
+                return os.pread(fd, size, offset)
+
+        else:
+
+            def read(offset, size):
+                f.seek(offset)
+                return f.read(size)
+
+        return _read_first_ifd_ascii_tags(read, tags)
+
 
 class SEMparams:
     """
@@ -44,8 +224,33 @@ class SEMparams:
     during instantiation and can also be stored as json.
     """
 
+    # instances are created in bulk by from_paths and the CLI,
+    # so they do without a per-instance __dict__
+    __slots__ = (
+        "img_path",
+        "img_type",
+        "img_header",
+        "params",
+        "params_grouped",
+        "software_version",
+    )
+
     TAGS = {"Zeiss": 34118, "ThermoFisher": 34682}
 
+    _TAG_ITEMS = tuple(TAGS.items())
+    _TAG_NUMBERS = frozenset(TAGS.values())
+    _TAGS_MISSING_MSG = (
+        "sem_io: The image does not appear to be from either "
+        f"{' or '.join(TAGS)} software. "
+        f"Missing tags {' and '.join(str(v) for v in TAGS.values())}."
+    )
+    _TAGS_AMBIGUOUS_MSG = (
+        "sem_io: Unclear image type: {} of tags "
+        f"{' and '.join(str(v) for v in TAGS.values())} "
+        "are present in this file."
+    )
+    _NOT_TIFF_MSG = "sem_io: The image is not a readable TIFF file."
+
     ZEISS_PARAM_LOCS = {
         "Dwell Time": "DP",
         "Dyn.Focus": "DP",
@@ -241,6 +446,24 @@ class SEMparams:
         "Stage": ["StageX", "StageY", "StageZ", "StageR", "StageTa", "WD"],
     }
 
+    # parameter and group names read from a header are replaced by these
+    # interned strings, so that all instances share one copy of each name
+    _INTERNED = _intern_names(ZEISS_PARAM_LOCS, ZEISS_GROUPS, TF_PARAM_LOCS, TF_GROUPS)
+
+    _ZEISS_TEMPLATE = _grouping_template(ZEISS_GROUPS, "File Name")
+    _ZEISS_PLAN = _grouping_plan(ZEISS_GROUPS, ZEISS_PARAM_LOCS)
+    # ThermoFisher parameters located under "#spec#" are stored in the
+    # group named after the detector and are resolved separately.
+    _TF_TEMPLATE = _grouping_template(TF_GROUPS, "FileName")
+    _TF_PLAN = tuple(
+        t for t in _grouping_plan(TF_GROUPS, TF_PARAM_LOCS) if t[2] != "#spec#"
+    )
+    _TF_SPEC_PLAN = tuple(
+        (grp, param)
+        for grp, param, loc in _grouping_plan(TF_GROUPS, TF_PARAM_LOCS)
+        if loc == "#spec#"
+    )
+
     @staticmethod
     def dwell_time_from_scan_speed(scan_speed):
         """
@@ -292,12 +515,13 @@ class SEMparams:
             the second element is a string which should correspond
             to the unit of the parameter.
         """
-        return (float(j.split(" ")[0]), j.split(j.split(" ")[0])[1].strip())
+        val, _, unit = j.partition(" ")
+        return (float(val), unit.strip())
 
     @staticmethod
     def get_image_type_and_header(image_path):
         """
-        Check that the image_path points to a .tif file and
+        Check that the image_path points to a .tif or .tiff file and
         raises an exception if not. Then looks for the tags
         34118 and 34682 in the file and returns a string
         specifying if the image was generated using the software
@@ -314,15 +538,18 @@ class SEMparams:
 
         Raises
         ------
-        Exception
-            If the image path does not point to a .tif file.
+        SEMIOError
+            If the image path does not point to a .tif or .tiff file.
 
-        Exception
+        SEMIOError
+            If the file cannot be read as a TIFF file.
+
+        SEMIOError
             If both tags 34118 and 34682 are missing from the .tif file,
             indicating that it was not generated by either Zeiss
             SmartSEM or by Thermo Fisher Scientific xT.
 
-        Exception
+        SEMIOError
             If both tags 34118 and 34682 are present in the .tif file,
             the image type is indeterminate.
 
@@ -334,29 +561,35 @@ class SEMparams:
         img_header : str
             String containing the data from the image header.
         """
-        if Path(image_path).suffix != ".tif":
-            msg = "sem_io: the image path must point to a .tif file."
-            raise Exception(msg) from None
-
-        n_matches = 0
-        with Image.open(image_path) as sem_img:
-            for t, v in SEMparams.TAGS.items():
-                if v in sem_img.tag:
-                    img_type = t
-                    img_header = sem_img.tag[v][0].strip()
-                    n_matches += 1
+        image_path = _check_tif_path(image_path)
+
+        tags = _read_tiff_ascii_tags(image_path, SEMparams._TAG_NUMBERS)
+        if tags is None:
+            try:
+                sem_img = Image.open(image_path)
+            except OSError:
+                raise SEMIOError(SEMparams._NOT_TIFF_MSG) from None
+            with sem_img:
+                if sem_img.format != "TIFF":
+                    raise SEMIOError(SEMparams._NOT_TIFF_MSG) from None
+                tags = {
+                    v: sem_img.tag[v][0]
+                    for v in SEMparams._TAG_NUMBERS
+                    if v in sem_img.tag
+                }
+
+        present = [(t, v) for t, v in SEMparams._TAG_ITEMS if v in tags]
+        n_matches = len(present)
 
         if n_matches == 0:
-            q_0 = "The image does not appear to be from either"
-            q_1 = " or ".join(SEMparams.TAGS.keys()) + " software. Missing tags"
-            q_2 = " and ".join(str(i) for i in SEMparams.TAGS.values()) + "."
-            raise Exception(" ".join(["sem_io:", q_0, q_1, q_2])) from None
+            raise SEMIOError(SEMparams._TAGS_MISSING_MSG) from None
 
         if n_matches > 1:
-            q_0 = f"Unclear image type: {n_matches} of tags"
-            q_1 = " and ".join(str(i) for i in SEMparams.TAGS.values())
-            q_2 = "are present in this file."
-            raise Exception(" ".join(["sem_io:", q_0, q_1, q_2])) from None
+            msg = SEMparams._TAGS_AMBIGUOUS_MSG.format(n_matches)
+            raise SEMIOError(msg) from None
+
+        img_type, tag = present[0]
+        img_header = tags[tag].strip()
 
         return img_type, img_header
 
@@ -377,6 +610,12 @@ class SEMparams:
             Str containing the image header read from tag 34118 of
             a .tif file from the Zeiss SmartSEM software.
 
+        Raises
+        ------
+        SEMIOError
+            If no line of the header starts with a letter, so that no
+            parameters can be found.
+
         Returns
         -------
         params : DICT
@@ -386,30 +625,34 @@ class SEMparams:
             and the value is the parameter string. This can either be
             a value and a unit or a text string.
         """
-        img_hdr = image_header.split("\r\n")
-
-        idx = [i for i, item in enumerate(img_hdr[:-1]) if item[0].isalpha()][0]
+        # split on real line endings only, as values may contain other
+        # characters which str.splitlines() would also break on
+        if "\r\n" in image_header:
+            img_hdr = image_header.split("\r\n")
+        else:
+            img_hdr = _LINE_END_RE.split(image_header)
+
+        idx = next(
+            (i for i in range(len(img_hdr) - 1) if img_hdr[i][:1].isalpha()), None
+        )
+        if idx is None:
+            msg = "sem_io: No parameters found in the Zeiss image header (tag 34118)."
+            raise SEMIOError(msg)
 
         locs = range(idx + 1, len(img_hdr), 2)
 
+        interned = SEMparams._INTERNED
         params = {"DP": {}, "AP": {}, "SV": {}}
         for i in locs:
-            t = img_hdr[i].find("=")
-            if t != -1:
-                k, v = img_hdr[i].split("=")
-                grp = img_hdr[i - 1][:2]
-                params[grp][k.strip()] = v.strip()
-            else:
-                t = img_hdr[i].find(":")
-                if t != -1:
-                    k = img_hdr[i][:t]
-                    v = img_hdr[i][t + 1 :]
-                    grp = img_hdr[i - 1][:2]
-                    params[grp][k.strip()] = v.strip()
+            kv = _split_kv(img_hdr[i])
+            if kv is not None:
+                k = kv[0].strip()
+                params[img_hdr[i - 1][:2]][interned.get(k, k)] = kv[1].strip()
 
-        s_sp = int(params["DP"]["Scan Speed"])
-        dw_t = SEMparams.dwell_time_from_scan_speed(s_sp)
-        params["DP"]["Dwell Time"] = f"{dw_t:.5e} s"
+        s_sp = params["DP"].get("Scan Speed")
+        if s_sp:
+            dw_t = SEMparams.dwell_time_from_scan_speed(int(s_sp))
+            params["DP"]["Dwell Time"] = f"{dw_t:.5e} s"
 
         if "V05" in params["SV"]["Version"]:
             pix_size = params["AP"].pop("Pixel Size")
@@ -433,8 +676,9 @@ class SEMparams:
         Note: currently (26/09/2023 with software version 23.3.1.22195)
         the groups following [HiResIllumination] are not properly
         separated with a double space: "\r\n\r\n". This appears
-        to be a bug in the software. This is why the extra fudge
-        is needed here to extract those last few groups properly.
+        to be a bug in the software. This is why the groups are
+        found from the lines starting with "[" rather than from the
+        blank lines between them.
 
 
         Parameters
@@ -454,26 +698,14 @@ class SEMparams:
             This can either be a value (no units are given) or a
             text string.
         """
+        interned = SEMparams._INTERNED
         params = {}
 
-        groups = image_header.split("\r\n\r\n")
-
-        for g in groups:
-            if g[:19] != "[HiResIllumination]":
-                p = g.split("\r\n")
-                params[p[0]] = {}
-                for i in p[1:]:
-                    j = i.split("=")
-                    params[p[0]][j[0].strip()] = j[1].strip()
-            else:
-                idx = [i for i, j in enumerate(g) if j == "["]
-                g_s = [g[i:j].split("\r\n") for i, j in zip(idx, idx[1:] + [None])]
-                for m in g_s:
-                    params[m[0]] = {}
-                    for n in m[1:]:
-                        if len(n) > 0:
-                            t = n.split("=")
-                            params[m[0]][t[0].strip()] = t[1].strip()
+        for m in _TF_GROUP_RE.finditer(image_header):
+            grp = m.group(1)
+            params[interned.get(grp, grp)] = {
+                interned.get(k, k): v for k, v in _TF_ENTRY_RE.findall(m.group(2))
+            }
 
         return params
 
@@ -502,14 +734,12 @@ class SEMparams:
             A 2-tuple containing the value of the image pixel size as
             a float and the unit as a string.
         """
-        img_type, img_header = SEMparams.get_image_type_and_header(image_path)
+        img_type, _, params = SEMparams._read_cached(image_path)
 
         if img_type == "Zeiss":
-            params = SEMparams.extract_params_Zeiss(img_header)
             img_pix_size = SEMparams.get_val(params["AP"]["Image Pixel Size"])
 
         elif img_type == "ThermoFisher":
-            params = SEMparams.extract_params_ThermoFisher(img_header)
             if "ElectronChannelingPatternIsOn" in params["[EBeam]"]:
                 if params["[EBeam]"]["ElectronChannelingPatternIsOn"] == "On":
                     img_pix_size = (
@@ -550,21 +780,13 @@ class SEMparams:
             keys "File Name" and "Manufacturer" are added to the
             "General" group.
         """
-        params_grouped = {
-            key: {k: "" for k in value}
-            for (key, value) in SEMparams.ZEISS_GROUPS.items()
-        }
+        params_grouped = {k: dict(v) for k, v in SEMparams._ZEISS_TEMPLATE.items()}
 
-        for k in params_grouped:
-            for j in params_grouped[k]:
-                g = SEMparams.ZEISS_PARAM_LOCS[j]
-                with contextlib.suppress(KeyError):
-                    params_grouped[k][j] = params[g][j]
+        for grp, param, loc in SEMparams._ZEISS_PLAN:
+            params_grouped[grp][param] = params.get(loc, _EMPTY).get(param, "")
 
-        gen_items = list(params_grouped["General"].items())
-        gen_items.insert(0, ("File Name", filename))
-        gen_items.insert(3, ("Manufacturer", manufacturer))
-        params_grouped["General"] = dict(gen_items)
+        params_grouped["General"]["File Name"] = filename
+        params_grouped["General"]["Manufacturer"] = manufacturer
 
         return params_grouped
 
@@ -595,22 +817,19 @@ class SEMparams:
             keys "FileName" and "Manufacturer" are added to the
             "General" group.
         """
-        params_grouped = {
-            key: {k: "" for k in value} for (key, value) in SEMparams.TF_GROUPS.items()
-        }
+        params_grouped = {k: dict(v) for k, v in SEMparams._TF_TEMPLATE.items()}
 
-        for k in params_grouped:
-            for j in params_grouped[k]:
-                g = SEMparams.TF_PARAM_LOCS[j]
-                if g == "#spec#":
-                    g = f"[{params['[Detectors]']['Name']}]"
-                with contextlib.suppress(KeyError):
-                    params_grouped[k][j] = params[g][j]
+        for grp, param, loc in SEMparams._TF_PLAN:
+            params_grouped[grp][param] = params.get(loc, _EMPTY).get(param, "")
 
-        gen_items = list(params_grouped["General"].items())
-        gen_items.insert(0, ("FileName", filename))
-        gen_items.insert(3, ("Manufacturer", manufacturer))
-        params_grouped["General"] = dict(gen_items)
+        det_name = params.get("[Detectors]", _EMPTY).get("Name")
+        if det_name is not None:
+            spec = params.get(f"[{det_name}]", _EMPTY)
+            for grp, param in SEMparams._TF_SPEC_PLAN:
+                params_grouped[grp][param] = spec.get(param, "")
+
+        params_grouped["General"]["FileName"] = filename
+        params_grouped["General"]["Manufacturer"] = manufacturer
 
         return params_grouped
 
@@ -639,11 +858,31 @@ class SEMparams:
         -------
         None.
         """
-        for i in p_dict:
-            print(f"{i} parameters:")
-            for j, k in p_dict[i].items():
-                print(f"\t{j} = {k}")
-            print()
+        sys.stdout.write(SEMparams._format_param_dict(p_dict))
+
+    @staticmethod
+    def _format_param_dict(p_dict):
+        """
+        Format a dict of params grouped under keys as the text printed
+        by print_param_dict().
+
+        Parameters
+        ----------
+        p_dict : DICT
+            A dict of dicts of parameters, see print_param_dict().
+
+        Returns
+        -------
+        STR
+            The formatted text, one line per group heading and per
+            parameter, each group followed by an empty line.
+        """
+        buf = []
+        for i, sub in p_dict.items():
+            buf.append(f"{i} parameters:\n")
+            buf.extend(f"\t{j} = {k}\n" for j, k in sub.items())
+            buf.append("\n")
+        return "".join(buf)
 
     @staticmethod
     def dump_params_to_json(p_dict, filename, image_path=None):
@@ -658,6 +897,11 @@ class SEMparams:
         a json file with the path filename. Optionally add
         the full path to the original image to the json.
 
+        If the optional dependency orjson is installed it is used to
+        write the json, otherwise the json module is used. Either way,
+        the file is written as UTF-8, with non-ASCII characters such
+        as "µ" unescaped.
+
         Parameters
         ----------
         p_dict : DICT
@@ -684,8 +928,90 @@ class SEMparams:
         if isinstance(image_path, str):
             p_d["Original image path"] = image_path
 
-        with open(filename, "w") as f:
-            json.dump(p_d, f, indent=2)
+        if orjson is not None:
+            opts = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+            with open(filename, "wb") as f:
+                f.write(orjson.dumps(p_d, option=opts))
+        else:
+            # UTF-8 and "\n" line endings, as written by orjson
+            with open(filename, "w", encoding="utf-8", newline="\n") as f:
+                json.dump(p_d, f, indent=2, ensure_ascii=False)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=256)
+    def _parse_cached(image_path, mtime_ns, size):
+        """
+        Read and parse the header of an SEM image, caching the result.
+
+        The modification time and size of the file are part of the
+        cache key only, so that a modified file is parsed again.
+
+        Parameters
+        ----------
+        image_path : STR
+            Absolute path to an SEM image (.tif) recorded with either
+            Zeiss SmartSEM or Thermo Fisher Scientific xT.
+        mtime_ns : INT
+            Modification time of the file in nanoseconds.
+        size : INT
+            Size of the file in bytes.
+
+        Returns
+        -------
+        tuple
+            A 3-tuple of the image type, the image header string and
+            the dict of all parameters extracted from the header.
+        """
+        img_type, img_header = SEMparams.get_image_type_and_header(image_path)
+
+        if img_type == "Zeiss":
+            params = SEMparams.extract_params_Zeiss(img_header)
+
+        elif img_type == "ThermoFisher":
+            params = SEMparams.extract_params_ThermoFisher(img_header)
+
+        return img_type, img_header, params
+
+    @staticmethod
+    def _read_cached(image_path):
+        """
+        Get the image type, header and parameters of an SEM image from
+        the cache of _parse_cached(), which reads the file only if it
+        has not been read before or has changed since.
+
+        The returned parameter dict is shared between callers and must
+        not be modified.
+
+        Parameters
+        ----------
+        image_path : STR | Path
+            Full path to an SEM image (.tif) recorded with either
+            Zeiss SmartSEM or Thermo Fisher Scientific xT.
+
+        Returns
+        -------
+        tuple
+            A 3-tuple of the image type, the image header string and
+            the dict of all parameters extracted from the header.
+        """
+        # check the extension first, so that a wrong path raises the
+        # same error as in get_image_type_and_header()
+        image_path = _check_tif_path(image_path)
+        st = os.stat(image_path)
+        return SEMparams._parse_cached(
+            os.path.abspath(image_path), st.st_mtime_ns, st.st_size
+        )
+
+    @staticmethod
+    def clear_cache():
+        """
+        Clear the cache of parsed image headers.
+
+        Returns
+        -------
+        None.
+        """
+        SEMparams._parse_cached.cache_clear()
 
     def __init__(self, image_path, verbose=True):
         """
@@ -704,27 +1030,77 @@ class SEMparams:
             as class attributes. The default is True.
         """
         self.img_path = Path(image_path)
-        self.img_type, self.img_header = SEMparams.get_image_type_and_header(
-            self.img_path
-        )
+        self.img_type, self.img_header, params = SEMparams._read_cached(self.img_path)
+        # copy the groups so that instances never modify the cached dict
+        self.params = {k: dict(v) for k, v in params.items()}
 
         if self.img_type == "Zeiss":
-            self.params = SEMparams.extract_params_Zeiss(self.img_header)
             self.params_grouped = SEMparams.group_parameters_Zeiss(
                 self.params, self.img_path.name, self.img_type
             )
             self.software_version = self.params["SV"]["Version"]
 
         elif self.img_type == "ThermoFisher":
-            self.params = SEMparams.extract_params_ThermoFisher(self.img_header)
             self.params_grouped = SEMparams.group_parameters_ThermoFisher(
                 self.params, self.img_path.name, self.img_type
             )
             self.software_version = self.params["[System]"]["Software"]
 
         if verbose:
-            print(f"\nParameters extracted from the SEM image: {self.img_path}\n")
-            SEMparams.print_param_dict(self.params_grouped)
+            self.print_params()
+
+    @classmethod
+    def from_paths(cls, image_paths, workers=None, verbose=False):
+        """
+        Create one SEMparams instance for each of several images, reading
+        the images concurrently in a pool of threads.
+
+        Most of the time spent on each image is file I/O, during which
+        the GIL is released, so threads read several images at once.
+        Images which were read before and are unchanged are taken from
+        the cache.
+
+        Parameters
+        ----------
+        image_paths : ITERABLE of STR | Path
+            Full paths to SEM images (.tif) recorded with either
+            Zeiss SmartSEM or Thermo Fisher Scientific xT.
+        workers : None or INT, optional
+            Maximum number of threads. The default is None, which uses
+            the default of concurrent.futures.ThreadPoolExecutor.
+        verbose : BOOL, optional
+            If True, the selected parameters of each image are printed
+            to stdout, in the order of image_paths, once all images have
+            been read. The default is False.
+
+        Returns
+        -------
+        LIST
+            The SEMparams instances, in the order of image_paths.
+        """
+        make = functools.partial(cls, verbose=False)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as ex:
+            instances = list(ex.map(make, image_paths))
+
+        if verbose:
+            for s_p in instances:
+                s_p.print_params()
+
+        return instances
+
+    def print_params(self):
+        """
+        Print the path of the image and the selected parameters,
+        grouped as in params_grouped, to stdout.
+
+        Returns
+        -------
+        None.
+        """
+        sys.stdout.write(
+            f"\nParameters extracted from the SEM image: {self.img_path}\n\n"
+            + SEMparams._format_param_dict(self.params_grouped)
+        )
 
     def __repr__(self):
         """Give some information about the instance."""